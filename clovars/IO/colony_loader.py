@@ -70,15 +70,15 @@ class ColonyLoader:
             treatment_regimen: dict[int, Treatment],
     ) -> Colony:
         """Creates a Colony based on the values in the input data and returns it."""
-        cells = []
-        for cell_index in range(1, initial_size + 1):
-            cell = self.create_cell(
+        cells = [
+            self.create_cell(
                 cell_data=cell_data,
                 colony_index=colony_index,
                 repeat_label=repeat_label,
                 cell_index=cell_index,
             )
-            cells.append(cell)
+            for cell_index in range(1, initial_size + 1)
+        ]
         return Colony(cells=cells, treatment_regimen=treatment_regimen)
 
     def create_cell(
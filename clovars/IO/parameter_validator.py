@@ -126,6 +126,11 @@ class RunParameterValidator(ParameterValidator):
         'stop_conditions.stop_at_all_colonies_size': ('optional', (int, NoneType), None),
         'verbose': ('optional', bool, True),
     }
+    stop_condition_keys = (
+        'stop_conditions.stop_at_frame',
+        'stop_conditions.stop_at_single_colony_size',
+        'stop_conditions.stop_at_all_colonies_size',
+    )
 
     def validate(self) -> None:
         """Validates the stop conditions before following onwards with base validation."""
@@ -134,12 +139,7 @@ class RunParameterValidator(ParameterValidator):
 
     def validate_stop_conditions(self) -> None:
         """Checks if at least one stop condition is present in the simulation."""
-        stop_condition_keys = [
-            'stop_conditions.stop_at_frame',
-            'stop_conditions.stop_at_single_colony_size',
-            'stop_conditions.stop_at_all_colonies_size',
-        ]
-        if not any(stop_condition_key in self.params for stop_condition_key in stop_condition_keys):
+        if not any(stop_condition_key in self.params for stop_condition_key in self.stop_condition_keys):
             prompt_message = 'No stop condition detected. Use default of stop at frame = 120? (y/n)'
             self.prompt_default(key='stop_conditions.stop_at_frame', default=120, prompt_message=prompt_message)
             self.params['stop_conditions.stop_at_single_colony_size'] = None
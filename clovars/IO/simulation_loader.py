@@ -95,7 +95,7 @@ class SimulationLoader:
         """
         treatment_data = {}
         treatment_params = [colony_data['treatment_data'] for colony_data in self.params['colony_data']]
-        colony_names = self.cell_data['colony_name'].str.extract(r'(\d)')[0].unique()
+        colony_names = self.cell_data['colony_name'].drop_duplicates().str.extract(r'(\d)')[0].unique()
         for treatment, colony_name in zip(treatment_params, colony_names):
             for treatment_frame, treatment_parameters in treatment.items():
                 key = (colony_name, int(treatment_frame))
@@ -3,6 +3,7 @@ from __future__ import annotations
 import itertools
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -141,14 +142,16 @@ class SimulationWriter(PathCreatorMixin):
             simulation_seconds: int,
     ) -> None:
         """Writes the current Cell information to the cell output csv file."""
+        cell_rows = ''.join(
+            self.cell_as_csv_row(
+                cell=cell,
+                current_frame=current_frame,
+                simulation_seconds=simulation_seconds,
+            )
+            for cell in well.cells
+        )
         with open(self.cell_csv_path, 'a') as cell_output_csv:
-            for cell in well.cells:
-                cell_row = self.cell_as_csv_row(
-                    cell=cell,
-                    current_frame=current_frame,
-                    simulation_seconds=simulation_seconds,
-                )
-                cell_output_csv.write(cell_row)
+            cell_output_csv.write(cell_rows)
 
     def cell_as_csv_row(
             self,
@@ -176,10 +179,7 @@ class SimulationWriter(PathCreatorMixin):
             f'{cell.fitness_memory.mother_memory},'
             f'{cell.fitness_memory.sister_memory},'
             f'{cell.linked_sister_inheritance},'
-            f'{current_frame},'
-            f'{simulation_seconds},'
-            f'{simulation_seconds / 3600},'
-            f'{simulation_seconds / (3600 * 24)}\n'
+            f'{self.simulation_time_columns(current_frame, simulation_seconds)}'
         )
 
     def write_colony_csv_header(self) -> None:
@@ -194,14 +194,16 @@ class SimulationWriter(PathCreatorMixin):
             simulation_seconds: int,
     ) -> None:
         """Writes the current Colony information to the colony output csv file."""
+        colony_rows = ''.join(
+            self.colony_as_csv_row(
+                colony=colony,
+                current_frame=current_frame,
+                simulation_seconds=simulation_seconds,
+            )
+            for colony in well
+        )
         with open(self.colony_csv_path, 'a') as colony_output_csv:
-            for colony in well:
-                colony_row = self.colony_as_csv_row(
-                    colony=colony,
-                    current_frame=current_frame,
-                    simulation_seconds=simulation_seconds,
-                )
-                colony_output_csv.write(colony_row)
+            colony_output_csv.write(colony_rows)
 
     def colony_as_csv_row(
             self,
@@ -218,6 +220,17 @@ class SimulationWriter(PathCreatorMixin):
             f'{colony.seconds_since_birth},'
             f'{colony.signal_mean()},'
             f'{colony.signal_std()},'
+            f'{self.simulation_time_columns(current_frame, simulation_seconds)}'
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def simulation_time_columns(
+            current_frame: int,
+            simulation_seconds: int,
+    ) -> str:
+        """Returns the trailing frame/time columns shared by every csv row written in the same frame."""
+        return (
             f'{current_frame},'
             f'{simulation_seconds},'
             f'{simulation_seconds / 3600},'
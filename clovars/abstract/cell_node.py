@@ -29,6 +29,10 @@ class CellNode(TreeNode):
     simulation_seconds: int = 0
     simulation_hours: float = 0.0
     simulation_days: float = 0.0
+    # Patterns used to parse the CellNode's name into a file name
+    colony_number_pattern = re.compile(r'^\d+')
+    colony_copy_letter_pattern = re.compile(r'[a-z]+')
+    branch_number_pattern = re.compile(r'\d+$')
 
     def __init__(
             self,
@@ -88,9 +92,9 @@ class CellNode(TreeNode):
     ) -> str:
         """Returns a filesystem-compatible version of the CellNode's name."""
         try:
-            colony_number = re.search(r'^\d+', self.name)[0].zfill(decimals)
-            colony_copy_letter = re.search(r'[a-z]+', self.name)[0]
-            branch_number = re.search(r'\d+$', self.name)[0].zfill(decimals)
+            colony_number = self.colony_number_pattern.search(self.name)[0].zfill(decimals)
+            colony_copy_letter = self.colony_copy_letter_pattern.search(self.name)[0]
+            branch_number = self.branch_number_pattern.search(self.name)[0].zfill(decimals)
         except TypeError:
             raise ValueError(f'Could not parse name: {self.name}')
         return f"{colony_number}{colony_copy_letter}{branch_number}"
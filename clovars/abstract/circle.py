@@ -6,6 +6,8 @@ import random
 
 class Circle:
     """Class representing an abstract Circle."""
+    __slots__ = ('x', 'y', '_radius')
+
     def __init__(
             self,
             x: float,
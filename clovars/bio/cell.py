@@ -18,6 +18,10 @@ class Cell:
     """Class representing a single Cell in a specific point in time and space."""
     cell_id_counter = itertools.count()
     min_time_to_division = 12 * 3600  # Wait at least 12h before dividing
+    fitness_inheritance_functions = {
+        'mother': 'inherit_from_mother',
+        'sister': 'inherit_from_sister',
+    }
 
     def __init__(
             self,
@@ -287,10 +291,7 @@ class Cell:
         """Returns a new death and division threshold by inheriting from the fitness source."""
         inheritance_type, cell_to_inherit = fitness_source
         try:
-            inheritance_function = {
-                'mother': self.fitness_memory.inherit_from_mother,
-                'sister': self.fitness_memory.inherit_from_sister,
-            }[inheritance_type]
+            inheritance_function = getattr(self.fitness_memory, self.fitness_inheritance_functions[inheritance_type])
         except KeyError:
             raise ValueError(f"Invalid inheritance type: {inheritance_type}")
         division_threshold = inheritance_function(cell_to_inherit.division_threshold)
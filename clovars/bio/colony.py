@@ -86,7 +86,9 @@ class Colony:
         """
         if not self:  # No Cells in Colony
             return None
-        return np.mean([cell.x for cell in self]).item(), np.mean([cell.y for cell in self]).item()
+        xs = np.fromiter((cell.x for cell in self), dtype=float, count=len(self))
+        ys = np.fromiter((cell.y for cell in self), dtype=float, count=len(self))
+        return xs.mean().item(), ys.mean().item()
 
     def is_dead(self) -> bool:
         """Returns whether all Cells in the Colony are dead or not."""
@@ -94,13 +96,17 @@ class Colony:
             return True
         return all(not cell.alive for cell in self)
 
+    def signal_values(self) -> np.ndarray:
+        """Returns the CellSignal values of all Cells in the Colony as a numpy array."""
+        return np.fromiter((cell.signal_value for cell in self.cells), dtype=float, count=len(self.cells))
+
     def signal_mean(self) -> float:
         """Returns the CellSignal mean across all Cells in the Colony."""
-        return np.mean([cell.signal_value for cell in self.cells]).item()
+        return self.signal_values().mean().item()
 
     def signal_std(self) -> float:
         """Returns the CellSignal standard deviation across all Cells in the Colony."""
-        return np.std([cell.signal_value for cell in self.cells]).item()
+        return self.signal_values().std().item()
 
     def pass_time(
             self,
@@ -109,19 +115,21 @@ class Colony:
     ) -> None:
         """Simulates the Colony for a given number of seconds (delta)."""
         cells_to_add = []
-        cells_to_drop = []
+        cells_to_drop = set()
         for cell in self:
             outcome = cell.pass_time(delta=delta, current_seconds=current_seconds)
             if outcome is None:  # Cell has died in the prior iteration, outcome is a None value
-                cells_to_drop.append(cell)
+                cells_to_drop.add(cell)
             elif isinstance(outcome, tuple):  # Cell has divided, outcome is a tuple of child Cells
                 cells_to_add.extend(outcome)
-                cells_to_drop.append(cell)
+                cells_to_drop.add(cell)
             elif outcome is cell:  # Cell has migrated or has just died in this iteration, outcome is the Cell itself
                 continue
             else:
                 raise ValueError(f"Cell.pass_time returned an unexpected outcome: {outcome}")
-        self.cells = [cell for cell in self.cells if cell not in cells_to_drop] + cells_to_add
+        if cells_to_drop:
+            self.cells = [cell for cell in self.cells if cell not in cells_to_drop]
+            self.cells.extend(cells_to_add)
         self.seconds_since_birth += delta
 
     def attempt_treatment_change(
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
 
 class Treatment:
     """Class representing a Treatment that influences Cells."""
+    default_curve = Gaussian()  # shared by all Treatments created without a curve: never mutate it
 
     def __init__(
             self,
@@ -23,10 +24,10 @@ class Treatment:
         if name is None:
             name = "Treatment"
         if division_curve is None:
-            division_curve = Gaussian()
+            division_curve = self.default_curve
         self.division_curve = division_curve
         if death_curve is None:
-            death_curve = Gaussian()
+            death_curve = self.default_curve
         self.name = name
         self.death_curve = death_curve
         self.signal_disturbance = signal_disturbance
@@ -105,6 +105,8 @@ class Well(Circle):
             colony.pass_time(delta=delta, current_seconds=current_seconds)
             if colony.is_dead():
                 dead_colonies.append(colony)
+        if not dead_colonies:
+            return
         self.colonies = [
             colony
             for colony in self.colonies
@@ -116,8 +118,9 @@ class Well(Circle):
             delta: int,
     ) -> None:
         """Sets the fate of each Cell for the next simulation frame."""
-        for cell in self.cells:
-            cell.set_cell_fate(delta=delta)
+        for colony in self:
+            for cell in colony:
+                cell.set_cell_fate(delta=delta)
 
     def modify_colony_treatment_regimens(
             self,
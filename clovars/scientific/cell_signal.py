@@ -46,6 +46,9 @@ class CellSignal:
 
 class SinusoidalCellSignal(CellSignal):
     """Represents a sinusoidal feature."""
+    amplitude = 1.0
+    vertical_shift = 0.0
+
     def __init__(
             self,
             initial_value: float = 0.0,
@@ -56,6 +59,10 @@ class SinusoidalCellSignal(CellSignal):
         self.period = period
         if self.period <= 0:
             raise ValueError(f"{self.__class__.__name__} period cannot be <= zero")
+        self.period_in_radians = 2 * np.pi / self.period
+        # The line below took me way longer to get right than I want to admit, but it actually works now
+        normalized_initial_value = (self.initial_value - self.vertical_shift) / self.amplitude
+        self.horizontal_shift = np.arcsin(normalized_initial_value) / self.period_in_radians
 
     def get_new_value(
             self,
@@ -71,12 +78,8 @@ class SinusoidalCellSignal(CellSignal):
             current_seconds: int,
     ) -> float:
         """Returns the sine wave evaluated at a specific point in time."""
-        amplitude = 1.0
-        vertical_shift = 0.0
-        period_in_radians = (2 * np.pi / self.period)
-        # The line below took me way longer to get right than I want to admit, but it actually works now
-        horizontal_shift = np.arcsin((self.initial_value - vertical_shift) / amplitude) / period_in_radians
-        return amplitude * np.sin(period_in_radians * (current_seconds + horizontal_shift)) + vertical_shift
+        sine = np.sin(self.period_in_radians * (current_seconds + self.horizontal_shift))
+        return self.amplitude * sine + self.vertical_shift
 
 
 class StochasticCellSignal(CellSignal):
@@ -51,17 +51,17 @@ class CurveEstimator:
 
     def __iter__(self) -> Iterator:
         """Iterates over the Curves, starting from the one with the smallest RSS."""
-        return iter(sorted(self.curves, key=lambda c: c.rss))
+        return iter(self.curves)
 
     def __getitem__(
             self,
             i: int,
     ) -> _CurveData:
         """Gets the i-th best fit Curve."""
-        return list(self)[i]
+        return self.curves[i]
 
     def fit_data(self) -> None:
-        """Writes the Curves fitted to the data to the estimations dictionary."""
+        """Writes the Curves fitted to the data to the estimations dictionary, sorted by their RSS."""
         # Sources:
         # https://stackoverflow.com/questions/6620471/fitting-empirical-distribution-to-theoretical-ones-with-scipy-python
         # https://en.wikipedia.org/wiki/Residual_sum_of_squares
@@ -73,6 +73,7 @@ class CurveEstimator:
             rss = np.sum(np.power(y - y_fit, 2.0)).item()
             curve = _CurveData(name=curve_name, rss=rss, params=params)
             self.curves.append(curve)
+        self.curves.sort(key=lambda c: c.rss)  # sorted once here, so that iteration and indexing need no sorting
 
     def get_curve_params(self, curve_type: Curve) -> Dict:
         """Returns a dictionary of the Curves parameters names and values."""
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import random
-from functools import partial
+from functools import lru_cache, partial
 from typing import Optional, TYPE_CHECKING
 
 import matplotlib.pyplot as plt
@@ -14,16 +14,28 @@ if TYPE_CHECKING:
 
 class AbstractCurve:
     """Class representing a gaussian curve."""
+    cdf_cache_size = 4096
+
     def __init__(self) -> None:
         """Initializes a Gaussian instance."""
         self.curve: Curve = norm()  # placeholder
+        self._cdf_cache: dict[Numeric, float] = {}
 
     def __call__(self, x: Optional[Numeric]) -> float:
         """
         Implements the call interface for AbstractCurve instances by returning the CDF of the underlying curve
-        (i.e. allows for the syntax "curve(x)" to be used).
+        (i.e. allows for the syntax "curve(x)" to be used). Scalar values are memoized (up to cdf_cache_size of them),
+        since Cells are evaluated at the same few time points over and over during a Simulation.
         """
-        return self.cdf(x)
+        if not np.isscalar(x):  # arrays, Series and lists are evaluated directly
+            return self.cdf(x)
+        try:
+            return self._cdf_cache[x]
+        except KeyError:
+            value = self.cdf(x)
+            if len(self._cdf_cache) < self.cdf_cache_size:
+                self._cdf_cache[x] = value
+            return value
 
     def draw_many(
             self,
@@ -44,6 +56,18 @@ class AbstractCurve:
         """Returns the point density function of the AbstractCurve evaluated at the given point X."""
         return self.curve.pdf(x)
 
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def x_grid(
+            x_min: int,
+            x_max: int,
+            x_steps: int,
+    ) -> np.ndarray:
+        """Returns a read-only array of evenly spaced X values, shared by every plot over the same interval."""
+        xs = np.linspace(x_min, x_max, x_steps)
+        xs.flags.writeable = False
+        return xs
+
     def plot_cdf(
             self,
             x_min: int = -25,
@@ -59,7 +83,7 @@ class AbstractCurve:
         """
         if ax is None:
             ax = plt.gca()
-        xs = np.linspace(x_min, x_max, x_steps)
+        xs = self.x_grid(x_min, x_max, x_steps)
         ys = self(xs)
         ax.plot(xs, ys, *args, **kwargs)
         return ax
@@ -79,7 +103,7 @@ class AbstractCurve:
         """
         if ax is None:
             ax = plt.gca()
-        xs = np.linspace(x_min, x_max, x_steps)
+        xs = self.x_grid(x_min, x_max, x_steps)
         ys = self.curve.pdf(xs)
         ax.plot(xs, ys, *args, **kwargs)
         return ax
@@ -104,9 +104,10 @@ class SimulationAnalyzer(QuietPrinterMixin, PathCreatorMixin):
         data = self.get_distribution_data()
         data_dict = {}
         for treatment_name, treatment_data in data.groupby('treatment'):
+            event_hours = {event: hours.head().values for event, hours in treatment_data.groupby('event')['hours']}
             data_dict[treatment_name] = self.get_data_stats(
-                division_values=treatment_data.loc[treatment_data['event'] == 'division'].head()['hours'].values,
-                death_values=treatment_data.loc[treatment_data['event'] == 'death'].head()['hours'].values,
+                division_values=event_hours.get('division', np.array([])),
+                death_values=event_hours.get('death', np.array([])),
                 n_events=len(treatment_data),
             )
         bootstrap_dict = {}
@@ -298,16 +299,10 @@ class SimulationAnalyzer(QuietPrinterMixin, PathCreatorMixin):
         filtered_colony_data = self.colony_data.loc[days.between(dynafit_start_day, dynafit_end_day)]
 
         # Gets GR and CS dataset
-        def get_daily_growth_rate(df: pd.DataFrame) -> float:
-            """Returns the daily growth rate for the input pandas DataFrame."""
-            seconds_to_days = 1 / (60 * 60 * 24)
-            first, last = df.iloc[0], df.iloc[-1]
-            upper = np.log2(last['size']) - np.log2(first['size'])
-            lower = (last['simulation_seconds'] * seconds_to_days) - (first['simulation_seconds'] * seconds_to_days)
-            return upper / lower
+        colony_groups = filtered_colony_data.groupby('name')
         dynafit_data = pd.DataFrame({
-            'growth_rate': filtered_colony_data.groupby('name').apply(get_daily_growth_rate),
-            'initial_colony_size': filtered_colony_data.groupby('name')['size'].first(),
+            'growth_rate': colony_groups.apply(self.get_daily_growth_rate),
+            'initial_colony_size': colony_groups['size'].first(),
         })
         # Avoids negative GRs
         dynafit_data.loc[dynafit_data['growth_rate'] <= 0, 'growth_rate'] = 0.5
@@ -334,18 +329,17 @@ class SimulationAnalyzer(QuietPrinterMixin, PathCreatorMixin):
         sns.violinplot(data=dynafit_data, ax=ax1, x='log2_CS', y='growth_rate', inner=None, color=".8")
         sns.stripplot(data=dynafit_data, ax=ax1, x='log2_CS', y='growth_rate')
         # Estimates DynaFit CVP from data
-        dfs = []
+        boot_columns = {'log2_CS': [], 'boot_repeat': [], 'log2_var_GR': [], 'log2_mean_CS': []}
         for boot_repeat in range(dynafit_bootstrap_n):
             self.quiet_print(f'Dynafit Bootstrap {boot_repeat + 1}/{dynafit_bootstrap_n}')
             sample = dynafit_data.groupby('log2_CS').sample(frac=1.0, replace=True)
             grouped_sample = sample.groupby('log2_CS')
-            boot = pd.DataFrame({
-                'boot_repeat': boot_repeat,
-                'log2_var_GR': np.log2(grouped_sample['growth_rate'].var()),
-                'log2_mean_CS': np.log2(grouped_sample['initial_colony_size'].mean()),
-            })
-            dfs.append(boot.reset_index())
-        dynafit_bootstrap_data = pd.concat(dfs, ignore_index=True)
+            growth_rate_var = grouped_sample['growth_rate'].var()
+            boot_columns['log2_CS'].append(growth_rate_var.index.to_numpy())
+            boot_columns['boot_repeat'].append(np.full(len(growth_rate_var), boot_repeat))
+            boot_columns['log2_var_GR'].append(np.log2(growth_rate_var.to_numpy()))
+            boot_columns['log2_mean_CS'].append(np.log2(grouped_sample['initial_colony_size'].mean().to_numpy()))
+        dynafit_bootstrap_data = pd.DataFrame({name: np.concatenate(arrays) for name, arrays in boot_columns.items()})
         dynafit_bootstrap_data = dynafit_bootstrap_data[np.isfinite(dynafit_bootstrap_data).all(1)]  # Drop nan / inf
         # Plots DynaFit CVP from data
         mean_xs = range(len(dynafit_bootstrap_data['log2_CS'].unique()))
@@ -365,6 +359,15 @@ class SimulationAnalyzer(QuietPrinterMixin, PathCreatorMixin):
         fig.tight_layout()
         plt.show()
 
+    @staticmethod
+    def get_daily_growth_rate(df: pd.DataFrame) -> float:
+        """Returns the daily growth rate for the input pandas DataFrame."""
+        seconds_to_days = 1 / (60 * 60 * 24)
+        first, last = df.iloc[0], df.iloc[-1]
+        upper = np.log2(last['size']) - np.log2(first['size'])
+        lower = (last['simulation_seconds'] * seconds_to_days) - (first['simulation_seconds'] * seconds_to_days)
+        return upper / lower
+
     def show_cell_fate_distributions(
             self,
             join_treatments: bool,
@@ -438,7 +441,7 @@ class SimulationAnalyzer(QuietPrinterMixin, PathCreatorMixin):
 
     def get_distribution_data(self) -> pd.DataFrame:
         """Returns a data of the Simulation distribution of division, death and migration times."""
-        terminal_nodes = self.cell_data.groupby('name').last()
+        terminal_nodes = self.cell_data.drop_duplicates(subset='name', keep='last').set_index('name').sort_index()
         data = pd.DataFrame({
             'event': terminal_nodes['fate_at_next_frame'],
             'hours': terminal_nodes['seconds_since_birth'] / (60 * 60),
@@ -455,8 +458,9 @@ class SimulationAnalyzer(QuietPrinterMixin, PathCreatorMixin):
 
     def show_cell_fitness_distributions(self) -> None:
         """Displays the fitness distributions across all Cell branches."""
-        death_dist = self.cell_data.groupby('name').first()['death_threshold'].values
-        division_dist = self.cell_data.groupby('name').first()['division_threshold'].values
+        first_cells = self.cell_data.groupby('name')[['death_threshold', 'division_threshold']].first()
+        death_dist = first_cells['death_threshold'].values
+        division_dist = first_cells['division_threshold'].values
         fig, ax = plt.subplots()
         sns.histplot(death_dist, ax=ax, kde=True, color='red', label='Death threshold', bins=50)
         sns.histplot(division_dist, ax=ax, kde=True, color='green', label='Division threshold', bins=50)
@@ -466,68 +470,28 @@ class SimulationAnalyzer(QuietPrinterMixin, PathCreatorMixin):
     def show_colony_division_times_cv(self) -> None:
         """Displays the CV of division times for each Colony."""
         # Get last cells in each branch
-        last_cells = self.cell_data.groupby('name').last().reset_index()
+        last_cells = self.cell_data.drop_duplicates(subset='name', keep='last')
         # Remove cells in last frame (they are at the branch end, but do not correspond to cells prior to division)
         last_cells = last_cells.loc[last_cells['simulation_seconds'] != self.cell_data['simulation_seconds'].max()]
 
         last_cells['hours_since_birth'] = last_cells['seconds_since_birth'] / (60 * 60)
 
         colony_generations = last_cells.groupby(['colony_name', 'generation'])
-        colony_hours_mean = colony_generations['hours_since_birth'].mean().reset_index()
-        colony_hours_var = colony_generations['hours_since_birth'].var().reset_index()
-        colony_hours_cv = (
-                colony_generations['hours_since_birth'].var() /
-                colony_generations['hours_since_birth'].mean()
-        ).reset_index().dropna()
-        fig, (ax1, ax2, ax3) = plt.subplots(nrows=3, sharex='all')
-        sns.violinplot(
-            data=self.filter_invalid(colony_hours_mean),
-            ax=ax1,
-            x='generation',
-            y='hours_since_birth',
-            palette='rocket',
-        )
-        sns.stripplot(
-            data=self.filter_invalid(colony_hours_mean),
-            ax=ax1,
-            x='generation',
-            y='hours_since_birth',
-            alpha=0.5,
-            color='0.5',
-        )
-        sns.violinplot(
-            data=self.filter_invalid(colony_hours_var),
-            ax=ax2,
-            x='generation',
-            y='hours_since_birth',
-            palette='rocket',
-        )
-        sns.stripplot(
-            data=self.filter_invalid(colony_hours_var),
-            ax=ax2,
-            x='generation',
-            y='hours_since_birth',
-            alpha=0.5,
-            color='0.5',
-        )
-        sns.violinplot(
-            data=self.filter_invalid(colony_hours_cv),
-            ax=ax3,
-            x='generation',
-            y='hours_since_birth',
-            palette='rocket',
-        )
-        sns.stripplot(
-            data=self.filter_invalid(colony_hours_cv),
-            ax=ax3,
-            x='generation',
-            y='hours_since_birth',
-            alpha=0.5,
-            color='0.5',
-        )
-        ax1.set_title('Hours since birth (mean)')
-        ax2.set_title('Hours since birth (var)')
-        ax3.set_title('Hours since birth (CV)')
+        hours_mean = colony_generations['hours_since_birth'].mean()
+        hours_var = colony_generations['hours_since_birth'].var()
+        colony_hours_mean = hours_mean.reset_index()
+        colony_hours_var = hours_var.reset_index()
+        colony_hours_cv = (hours_var / hours_mean).reset_index().dropna()
+        fig, axes = plt.subplots(nrows=3, sharex='all')
+        for ax, colony_hours, label in zip(
+                axes,
+                [colony_hours_mean, colony_hours_var, colony_hours_cv],
+                ['mean', 'var', 'CV'],
+        ):
+            valid_colony_hours = self.filter_invalid(colony_hours)
+            sns.violinplot(data=valid_colony_hours, ax=ax, x='generation', y='hours_since_birth', palette='rocket')
+            sns.stripplot(data=valid_colony_hours, ax=ax, x='generation', y='hours_since_birth', alpha=0.5, color='0.5')
+            ax.set_title(f'Hours since birth ({label})')
         plt.show()
 
     @staticmethod
@@ -550,8 +514,9 @@ class SimulationAnalyzer(QuietPrinterMixin, PathCreatorMixin):
             ax.clear()
             ax.scatter(previous_xs, previous_ys, color='gray', alpha=0.3, s=2)
             current_data = days_groups[i]
-            current_xs = current_data.groupby('colony_name').count().iloc[:, 0]
-            current_ys = current_data.groupby('colony_name')['signal_value'].var()
+            colony_groups = current_data.groupby('colony_name')
+            current_xs = colony_groups.size()
+            current_ys = colony_groups['signal_value'].var()
             ax.scatter(current_xs, current_ys, color='blue', s=10)
             previous_xs.extend(current_xs.values)
             previous_ys.extend(current_ys.values)
@@ -575,8 +540,9 @@ class SimulationAnalyzer(QuietPrinterMixin, PathCreatorMixin):
             self.quiet_print(f'Processing frame: {i + 1}/{n_days}')
             ax.clear()
             current_data = days_groups[i]
-            division_thresholds = current_data.groupby('colony_name')['division_threshold'].mean().values
-            death_thresholds = current_data.groupby('colony_name')['death_threshold'].mean().values
+            colony_thresholds = current_data.groupby('colony_name')[['division_threshold', 'death_threshold']].mean()
+            division_thresholds = colony_thresholds['division_threshold'].values
+            death_thresholds = colony_thresholds['death_threshold'].values
             sns.kdeplot(division_thresholds, ax=ax, color='#50983e', label='Division threshold', alpha=0.7)
             sns.rugplot(division_thresholds, ax=ax, color='#50983e')
             sns.kdeplot(death_thresholds, ax=ax, color='#983e50', label='Death threshold', alpha=0.7)
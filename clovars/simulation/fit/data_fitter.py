@@ -17,6 +17,14 @@ from clovars.utils import QuietPrinterMixin
 
 class DataFitter(QuietPrinterMixin):
     """Class responsible for estimating the best-fit curve for a given dataset."""
+    latex_translation_table = str.maketrans('', '', '$\\')
+    candidate_curves = (
+        ('Gaussian', norm, (r'$\mu$', r'$\sigma$')),
+        ('EMGaussian', exponnorm, (r'$K$', r'$\mu$', r'$\sigma$')),
+        ('Gamma', gamma, (r'$a$', r'$\mu$', r'$\sigma$')),
+        ('Lognormal', lognorm, (r'$s$', r'$\mu$', r'$\sigma$')),
+    )
+
     def __init__(
             self,
             input_file: str,
@@ -99,8 +107,8 @@ class DataFitter(QuietPrinterMixin):
             self.quiet_print(f'Skipped calculations for death column because it is None.')
         self.quiet_print('------\n')
 
-    @staticmethod
-    def calculate_best_fit(data: np.ndarray) -> dict[str, Any]:
+    @classmethod
+    def calculate_best_fit(cls, data: np.ndarray) -> dict[str, Any]:
         """Calculates the best fit data and saves it to the fit_data attribute."""
         # Sources:
         # https://stackoverflow.com/questions/6620471/fitting-empirical-distribution-to-theoretical-ones-with-scipy-python
@@ -108,12 +116,7 @@ class DataFitter(QuietPrinterMixin):
         y, x = np.histogram(data, density=True)
         x = (x + np.roll(x, -1))[:-1] / 2.0
         fit_data = {}
-        for label, func, param_labels in [
-            ('Gaussian', norm, ('$\mu$', '$\sigma$')),
-            ('EMGaussian', exponnorm, ('$K$', '$\mu$', '$\sigma$')),
-            ('Gamma', gamma, ('$a$', '$\mu$', '$\sigma$')),
-            ('Lognormal', lognorm, ('$s$', '$\mu$', '$\sigma$')),
-        ]:
+        for label, func, param_labels in cls.candidate_curves:
             param_values = func.fit(data)
             fit_data[label] = {
                 'func': func,
@@ -146,7 +149,7 @@ class DataFitter(QuietPrinterMixin):
             rank = self.to_ordinal(i)
             RMSE = fit_values['RMSE']
             params_str = '\n    '.join([
-                k.replace('$', '').replace('\\', '') + f" = {v}"
+                k.translate(self.latex_translation_table) + f" = {v}"
                 for k, v in fit_values['named_params'].items()
             ])
             print(
@@ -174,9 +174,9 @@ class SimulationViewer(QuietPrinterMixin, PathCreatorMixin):
         except KeyError:  # Stop condition
             return node
         current_node = node
-        for i, data in data.iterrows():
+        for row in data.to_dict('records'):
             next_node = CellNode(name=root_name)
-            next_node.add_features(**data.to_dict())
+            next_node.add_features(**row)
             try:
                 current_node.add_child(next_node)  # noqa
             except AttributeError:  # current_node is None
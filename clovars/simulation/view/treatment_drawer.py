@@ -47,15 +47,17 @@ class TreatmentDrawer:
             show_division: bool,
     ) -> Generator[tuple[plt.Figure, str], None, None]:
         """Sequentially yields gaussian Figures from the Simulation view."""
+        if show_death is False and show_division is False:  # No curves to draw, so there is no need for empty Figures
+            return
         for (colony_name, treatment_frame), treatment in self.treatment_data.items():
             fig, ax = plt.subplots()
             suffix = ''
             if show_death is True:
                 suffix += 'death'
-                treatment.death_curve.plot_pdf(ax=ax, x_steps=100_000, color='#E96F00', label='Death')
+                treatment.death_curve.plot_pdf(ax=ax, color='#E96F00', label='Death')
             if show_division is True:
                 suffix += 'div'
-                treatment.division_curve.plot_pdf(ax=ax, x_steps=100_000, color='#0098B1', label='Division')
+                treatment.division_curve.plot_pdf(ax=ax, color='#0098B1', label='Division')
             label = f'{treatment.name}_{suffix}'
             fig.suptitle(
                 f'Treatment {treatment.name} added on frame {treatment_frame}'
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -8,6 +9,7 @@ import pandas as pd
 from matplotlib import pyplot as plt
 from matplotlib.animation import ArtistAnimation
 from matplotlib.cm import get_cmap
+from matplotlib.collections import LineCollection
 from matplotlib.colors import Normalize
 
 from clovars.utils import QuietPrinterMixin
@@ -28,6 +30,22 @@ class TreeDrawer2D(QuietPrinterMixin):
         'death',
         'signal',
     ]
+    node_color_getters = {
+        'family': 'get_family_color',
+        'time': 'get_time_color',
+        'age': 'get_age_color',
+        'generation': 'get_generation_color',
+        'division': 'get_division_color',
+        'death': 'get_death_color',
+        'signal': 'get_signal_color',
+    }
+    colorbar_labels = {
+        'age': 'Cell Age (h)',
+        'generation': 'Generation',
+        'division': 'Division Threshold',
+        'death': 'Death Threshold',
+        'signal': 'Signal Value',
+    }
 
     def __init__(
             self,
@@ -118,15 +136,13 @@ class TreeDrawer2D(QuietPrinterMixin):
             ax: plt.Axes,
     ) -> None:
         """Draws the branches between parent and child nodes in the tree."""
+        segments = []
         for node in root_node.traverse():
-            parent_x = node.simulation_hours
-            parent_y = self.get_height_from_name(name=node.name)
+            parent_xy = (node.simulation_hours, self.get_height_from_name(name=node.name))
             for child_node in node.children:
-                child_x = child_node.simulation_hours
-                child_y = self.get_height_from_name(name=child_node.name)
-                xs = [parent_x, child_x]
-                ys = [parent_y, child_y]
-                ax.plot(xs, ys, c='0.7', linewidth=0.5, zorder=1)
+                child_xy = (child_node.simulation_hours, self.get_height_from_name(name=child_node.name))
+                segments.append([parent_xy, child_xy])
+        ax.add_collection(LineCollection(segments, colors='0.7', linewidths=0.5, zorder=1))
 
     def draw_cells(
             self,
@@ -170,6 +186,7 @@ class TreeDrawer2D(QuietPrinterMixin):
         return self.get_height_from_name(name=node.name)
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def get_height_from_name(name: str) -> float:
         """Returns the height of the CellNode in a 2D tree, given its name."""
         height = 0.0
@@ -187,15 +204,7 @@ class TreeDrawer2D(QuietPrinterMixin):
             node: CellNode,
     ) -> float | str:
         """Returns the CellNode's color in the plot."""
-        return {
-            'family': self.get_family_color,
-            'time': self.get_time_color,
-            'age': self.get_age_color,
-            'generation': self.get_generation_color,
-            'division': self.get_division_color,
-            'death': self.get_death_color,
-            'signal': self.get_signal_color,
-        }[self.layout](node=node)
+        return getattr(self, self.node_color_getters[self.layout])(node=node)
 
     @staticmethod
     def get_family_color(node: CellNode) -> str:
@@ -325,20 +334,8 @@ class TreeDrawer2D(QuietPrinterMixin):
             ax: plt.Axes,
     ) -> None:
         """Adds a colorbar to the Figure."""
-        norm = {
-            'age': self.age_normalizer,
-            'generation': self.generation_normalizer,
-            'division': self.division_normalizer,
-            'death': self.death_normalizer,
-            'signal': self.signal_normalizer,
-        }[self.layout]
-        label = {
-            'age': 'Cell Age (h)',
-            'generation': 'Generation',
-            'division': 'Division Threshold',
-            'death': 'Death Threshold',
-            'signal': 'Signal Value',
-        }[self.layout]
+        label = self.colorbar_labels[self.layout]
+        norm = getattr(self, f'{self.layout}_normalizer')
         mappable = plt.cm.ScalarMappable(norm=norm, cmap=self.colormap)
         figure.colorbar(mappable=mappable, ax=ax, label=label, orientation='horizontal', fraction=0.05)
 
@@ -25,6 +25,21 @@ class TreeDrawer3D:
         'death',
         'signal',
     ]
+    segment_color_getters = {
+        'time': 'get_time_color',
+        'age': 'get_age_color',
+        'generation': 'get_generation_color',
+        'division': 'get_division_color',
+        'death': 'get_death_color',
+        'signal': 'get_signal_color',
+    }
+    colorbar_labels = {
+        'age': 'Cell Age (h)',
+        'generation': 'Generation',
+        'division': 'Division Threshold',
+        'death': 'Death Threshold',
+        'signal': 'Signal Value',
+    }
 
     def __init__(
             self,
@@ -172,14 +187,7 @@ class TreeDrawer3D:
             branch_segment: list[CellNode],
     ) -> float:
         """Returns the color for the branch segment."""
-        values = {
-            'time': self.get_time_color,
-            'age': self.get_age_color,
-            'generation': self.get_generation_color,
-            'division': self.get_division_color,
-            'death': self.get_death_color,
-            'signal': self.get_signal_color,
-        }[self.layout](branch_segment=branch_segment)
+        values = getattr(self, self.segment_color_getters[self.layout])(branch_segment=branch_segment)
         return self.colormap(np.mean(values))
 
     def get_time_color(
@@ -280,7 +288,7 @@ class TreeDrawer3D:
             root_node: CellNode,
     ) -> None:
         """Draws the leaf Cells on a matplotlib 3D plot."""
-        dead_nodes = root_node.search_nodes(fate_at_next_frame='death')
+        dead_nodes = set(root_node.search_nodes(fate_at_next_frame='death'))
         leaf_nodes = [node for node in root_node.get_leaves() if node not in dead_nodes]
         self.draw_cell_nodes(ax=ax, cell_nodes=leaf_nodes)
 
@@ -290,20 +298,8 @@ class TreeDrawer3D:
             ax: plt.Axes,
     ) -> None:
         """Adds a colorbar to the Figure."""
-        norm = {
-            'age': self.age_normalizer,
-            'generation': self.generation_normalizer,
-            'division': self.division_normalizer,
-            'death': self.death_normalizer,
-            'signal': self.signal_normalizer,
-        }[self.layout]
-        label = {
-            'age': 'Cell Age (h)',
-            'generation': 'Generation',
-            'division': 'Division Threshold',
-            'death': 'Death Threshold',
-            'signal': 'Signal Value',
-        }[self.layout]
+        label = self.colorbar_labels[self.layout]
+        norm = getattr(self, f'{self.layout}_normalizer')
         mappable = plt.cm.ScalarMappable(norm=norm, cmap=self.colormap)
         figure.colorbar(mappable=mappable, ax=ax, label=label, shrink=0.5)
 
@@ -246,6 +246,11 @@ class TestSimulationWriter(unittest.TestCase):
         self.assertIsInstance(row, str)
         self.assertEqual(len(row.split(',')), len(self.simulation_writer.colony_csv_header.split(',')))
 
+    def test_simulation_time_columns_returns_frame_seconds_hours_and_days(self) -> None:
+        """Tests whether the "simulation_time_columns" method returns the frame and time columns of a csv row."""
+        row = self.simulation_writer.simulation_time_columns(3, 7200)
+        self.assertEqual(row, f'3,7200,{7200 / 3600},{7200 / (3600 * 24)}\n')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -127,6 +127,17 @@ class TestColony(unittest.TestCase):
             cell.die()
             self.assertTrue(self.colony.is_dead())
 
+    def test_signal_values_method_returns_an_array_of_all_cell_signals(self) -> None:
+        """Tests whether the Colony "signal_values" method returns a numpy array with the Signal of each Cell."""
+        signal_values = [1.0, 0.5, 0.0, -0.5, -1.0]
+        self.colony.cells = [
+            Cell(signal=ConstantCellSignal(initial_value=initial_value))
+            for initial_value in signal_values
+        ]
+        return_value = self.colony.signal_values()
+        self.assertIsInstance(return_value, np.ndarray)
+        np.testing.assert_array_equal(return_value, signal_values)
+
     def test_signal_mean_method_returns_the_mean_across_all_cell_signals(self) -> None:
         """Tests whether the Colony "signal_mean" property returns the Signal mean across all Cells in the Colony."""
         signal_values = [1.0, 0.5, 0.0, -0.5, -1.0]
@@ -33,6 +33,12 @@ class TestTreatment(unittest.TestCase):
         self.assertTrue(hasattr(self.treatment, 'death_curve'))
         self.assertIsInstance(self.treatment.death_curve, Gaussian)
 
+    def test_treatment_uses_default_curve_when_curves_are_not_given(self) -> None:
+        """Tests whether a Treatment uses the shared default Curve when initialized without division or death curves."""
+        treatment = Treatment()
+        self.assertIs(treatment.division_curve, Treatment.default_curve)
+        self.assertIs(treatment.death_curve, Treatment.default_curve)
+
     def test_treatment_has_signal_disturbance_attribute(self) -> None:
         """Tests whether a Treatment has a "signal_disturbance" attribute (a dictionary or None type)."""
         self.assertTrue(hasattr(self.treatment, 'signal_disturbance'))
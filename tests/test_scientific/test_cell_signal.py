@@ -124,6 +124,13 @@ class TestSinusoidalCellSignal(unittest.TestCase):
             with self.subTest(current_seconds=current_seconds, expected_sine=expected_sine, actual_sine=actual_sine):
                 self.assertAlmostEqual(expected_sine, actual_sine)  # Due to rounding errors on floats
 
+    def test_sine_method_starts_at_initial_value(self) -> None:
+        """Tests whether the "sine" method returns the SinusoidalCellSignal's initial value at time zero."""
+        for initial_value in [-1.0, -0.5, 0.0, 0.3, 1.0]:
+            signal = SinusoidalCellSignal(initial_value=initial_value)
+            with self.subTest(initial_value=initial_value):
+                self.assertAlmostEqual(signal.sine(current_seconds=0), initial_value)
+
 
 class TestStochasticCellSignal(unittest.TestCase):
     """Class representing unit-tests for clovars.scientific.cell_signal.StochasticCellSignal class."""
@@ -3,6 +3,7 @@ from unittest import mock
 from unittest.mock import MagicMock
 
 import numpy as np
+import pandas as pd
 from scipy.stats import exponnorm, gamma, lognorm, norm
 
 from clovars.scientific import AbstractCurve, EMGaussian, Gamma, Gaussian, Lognormal, get_curve
@@ -20,6 +21,30 @@ class TestAbstractCurve(unittest.TestCase):
             self.dist(1)
         mock_cdf.assert_called_once_with(1)
 
+    def tests_call_curve_memoizes_only_scalar_values(self) -> None:
+        """Tests whether calling a Curve memoizes scalar values, but always passes array-likes to its cdf function."""
+        for curve_class in (AbstractCurve, Gaussian, EMGaussian, Gamma, Lognormal):
+            dist = curve_class()
+            with self.subTest(curve_class=curve_class), mock.patch.object(dist, 'cdf', return_value=0.5) as mock_cdf:
+                self.assertEqual(dist(1), dist(1))
+                mock_cdf.assert_called_once_with(1)
+                mock_cdf.reset_mock()
+                for xs in (np.array([1.0, 2.0]), pd.Series([1.0, 2.0]), [1.0, 2.0]):
+                    dist(xs)
+                    dist(xs)
+                self.assertEqual(mock_cdf.call_count, 6)
+
+    def tests_call_curve_stops_memoizing_when_the_cache_is_full(self) -> None:
+        """Tests whether calling a Curve never stores more than cdf_cache_size scalar values."""
+        for curve_class in (AbstractCurve, Gaussian, EMGaussian, Gamma, Lognormal):
+            dist = curve_class()
+            dist.cdf_cache_size = 2
+            with self.subTest(curve_class=curve_class):
+                for x in range(5):
+                    dist(x)
+                self.assertEqual(len(dist._cdf_cache), 2)
+                self.assertAlmostEqual(dist(4), dist.cdf(4))
+
     def test_draw_many_method_calls_curve_rvs_method_with_size_argument(self) -> None:
         """Tests whether the "draw_many" method returns calls the curve's "rvs" method with the given size argument."""
         self.dist.curve.rvs = MagicMock()
@@ -52,6 +77,13 @@ class TestAbstractCurve(unittest.TestCase):
         self.dist.pdf(x=10)
         self.dist.curve.pdf.assert_called_with(10)
 
+    def test_x_grid_method_returns_the_same_read_only_array_for_the_same_interval(self) -> None:
+        """Tests whether the "x_grid" method returns a cached, read-only array of evenly spaced values."""
+        xs = self.dist.x_grid(0, 10, 11)
+        np.testing.assert_array_equal(xs, np.linspace(0, 10, 11))
+        self.assertFalse(xs.flags.writeable)
+        self.assertIs(xs, self.dist.x_grid(0, 10, 11))
+
     @mock.patch('clovars.scientific.curves.plt.Axes')
     def test_plot_cdf_method_returns_an_axes_instance(
             self,
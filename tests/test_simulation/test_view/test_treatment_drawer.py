@@ -75,6 +75,13 @@ class TestTreatmentDrawer(NotEmptyTestCase):
         return_value = list(self.treatment_drawer.yield_curves(show_division=True, show_death=True))
         self.assertEqual(len(return_value), 0)
 
+    def test_yield_curves_yields_empty_sequence_if_no_curves_are_shown(self) -> None:
+        """Tests whether the "yield_curves" method yields nothing if neither the death nor division Curves are shown."""
+        with mock.patch('clovars.simulation.view.treatment_drawer.plt') as mock_plt:
+            return_value = list(self.treatment_drawer.yield_curves(show_division=False, show_death=False))
+        self.assertEqual(len(return_value), 0)
+        mock_plt.subplots.assert_not_called()
+
     def test_yield_curves_calls_death_curve_plot_pdf_if_death_gaussian_is_true(self) -> None:
         """Tests whether the "yield_curves" method draws the death Curve if the "show_death" parameter is True."""
         return_value = list(self.treatment_drawer.yield_curves(show_division=True, show_death=False))
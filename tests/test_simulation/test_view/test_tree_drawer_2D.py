@@ -101,10 +101,26 @@ class TestTreeDrawer2D(unittest.TestCase):
         """Docstring."""
         self.fail("Write the test!")
 
-    @unittest.skipIf(SKIP_TESTS is True, "SKIP TESTS is set to True")
-    def test_get_height_from_name_method_(self) -> None:
-        """Docstring."""
-        self.fail("Write the test!")
+    def test_get_height_from_name_method_returns_height_from_branch_name(self) -> None:
+        """Tests whether the "get_height_from_name" method returns the height given by the branch name."""
+        names = {
+            '1a-1': 0.0,
+            '1a-1.1': 0.5,
+            '1a-1.2': -0.5,
+            '1a-1.1.2': 0.25,
+            '1a-1.2.2.1': -0.625,
+        }
+        for name, expected_height in names.items():
+            with self.subTest(name=name, expected_height=expected_height):
+                self.assertEqual(self.tree_drawer_2D.get_height_from_name(name=name), expected_height)
+
+    def test_get_height_from_name_method_caches_repeated_names(self) -> None:
+        """Tests whether the "get_height_from_name" method returns repeated names from its cache."""
+        TreeDrawer2D.get_height_from_name.cache_clear()
+        first_height = self.tree_drawer_2D.get_height_from_name(name='1a-1.2.1')
+        second_height = self.tree_drawer_2D.get_height_from_name(name='1a-1.2.1')
+        self.assertEqual(first_height, second_height)
+        self.assertEqual(TreeDrawer2D.get_height_from_name.cache_info().hits, 1)
 
     @unittest.skipIf(SKIP_TESTS is True, "SKIP TESTS is set to True")
     def test_get_node_color_method_(self) -> None: